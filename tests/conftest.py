@@ -34,6 +34,10 @@ def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
     parameterized tests see:
     https://docs.pytest.org/en/6.2.x/example/parametrize.html#a-quick-port-of-testscenarios
 
+    Scenario arguments listed in the optional ``scenario_fixtures`` class
+    attribute are passed indirectly, i.e. to a fixture of the same name via
+    ``request.param``, rather than directly to the test.
+
     """
     # Return if the test is not part of a class or if the class does not
     # have a scenarios attribute.
@@ -47,7 +51,13 @@ def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
         items = scenario[1].items()
         argnames = [x[0] for x in items]
         argvalues.append([x[1] for x in items])
-    metafunc.parametrize(argnames, argvalues, ids=idlist, scope="class")
+    metafunc.parametrize(
+        argnames,
+        argvalues,
+        ids=idlist,
+        scope="class",
+        indirect=getattr(metafunc.cls, "scenario_fixtures", False),
+    )
 
 
 # -------------------------------------------------------------------------------------
@@ -616,6 +616,32 @@ def test_sqlite_drop_index_error(fill_store: Callable, tmp_path: Path) -> None:
         store.drop_index("test_index")
 
 
+@pytest.mark.parametrize("store_cls", [DictionaryStore, SQLiteStore])
+def test_query_contains_and_sum(store_cls: type[AnnotationStore]) -> None:
+    """Test contains and sum predicates on list and dict properties."""
+    store = store_cls()
+    keys = store.append_many(
+        [
+            Annotation(Point(0, 0), {"list": [1, 2, 3], "dict": {"a": 1}}),
+            Annotation(Point(1, 1), {"list": [4, 5], "dict": {"b": 2}}),
+            Annotation(Point(2, 2), {"list": [], "dict": {}}),
+        ],
+    )
+    # `x in y` coerces the result to bool, so call __contains__ directly
+    assert set(store.query(where="props['list'].__contains__(2)")) == {keys[0]}
+    assert set(store.query(where="props['dict'].__contains__('b')")) == {keys[1]}
+    assert set(store.query(where="props['dict'].__contains__(1)")) == set()
+    assert set(store.query(where="sum(props['list']) == 9")) == {keys[1]}
+    assert set(store.query(where="sum(props['list']) == 0")) == {keys[2]}
+    # A missing property never matches (SQLite gives NULL, Python raises)
+    for where in ("sum(props['missing']) < 5", "props['missing'].__contains__(1)"):
+        if store_cls is SQLiteStore:
+            assert set(store.query(where=where)) == set()
+        else:
+            with pytest.raises(KeyError):
+                store.query(where=where)
+
+
 def test_sqlite_store_unsupported_compression(sample_triangle: Polygon) -> None:
     """Test that using an unsupported compression str raises error."""
     store = SQLiteStore(compression="foo")
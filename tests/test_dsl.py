@@ -2,22 +2,28 @@
 from __future__ import annotations
 
 import json
+import logging
 import sqlite3
-from numbers import Number
-from typing import Callable, ClassVar, Mapping
+from functools import lru_cache, partial
+from types import CodeType, MappingProxyType
+from typing import TYPE_CHECKING, Callable, ClassVar, Iterator, Mapping, Sequence
 
 import pytest
 
+from tiatoolbox import logger
 from tiatoolbox.annotation.dsl import (
     PY_GLOBALS,
     SQL_GLOBALS,
     SQLJSONDictionary,
     SQLTriplet,
     json_contains,
-    json_list_sum,
     py_regexp,
+    sql_list_sum,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    from numbers import Number
+
 BINARY_OP_STRINGS = [
     "+",
     "-",
@@ -36,6 +42,8 @@ BINARY_OP_STRINGS = [
     "%",
 ]
 PREFIX_OP_STRINGS = ["-", "not "]
+# Concrete result types, checked directly rather than via the numbers.Number ABC.
+_NUMBER_TYPES = (int, float)
 FUNCTION_NAMES = ["abs", "is_none", "is_not_none", "has_key"]
 SAMPLE_PROPERTIES = {
     "int": 2,
@@ -47,6 +55,61 @@ SAMPLE_PROPERTIES = {
     "bool": True,
     "nesting": {"fib": [1, 1, 2, 3, 5], "foo": {"bar": "baz"}},
 }
+SAMPLE_PROPERTIES_JSON = json.dumps(SAMPLE_PROPERTIES)
+SAMPLE_SCHEMA = {"int": int, "neg": int, "bool": bool, "list": list}
+
+
+def _freeze(value: object) -> object:
+    """Recursively convert dicts and lists to read-only mappings and tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Shared, read-only props objects for the Python and SQLite scenarios.
+_PROPS_PY = _freeze(SAMPLE_PROPERTIES)
+_PROPS_SQL = SQLJSONDictionary()
+_PROPS_SQL_SCHEMA = SQLJSONDictionary(schema=SAMPLE_SCHEMA)
+
+
+@lru_cache(maxsize=None)
+def _compile_eval(source: str) -> CodeType:
+    """Compile a DSL query string once and reuse the code object.
+
+    The same query strings are evaluated for every scenario, so caching
+    the compiled code avoids re-parsing the source on each `eval`.
+
+    """
+    return compile(source, "<dsl>", "eval")
+
+
+_THUNKS: dict[tuple[str, int, int], tuple[dict, Mapping, Callable]] = {}
+
+
+def _make_thunk(
+    source: str,
+    eval_globals: dict[str, object],
+    eval_locals: Mapping[str, object],
+) -> Callable[[], object]:
+    """Return a zero-argument function evaluating a DSL query.
+
+    The query is compiled into a lambda over the merged globals and
+    locals once per (query, globals, locals), so repeated evaluations
+    are plain function calls rather than `eval` calls. The namespaces
+    are kept in the cache so that their ids stay valid keys.
+
+    """
+    key = (source, id(eval_globals), id(eval_locals))
+    if key not in _THUNKS:
+        namespace = {**eval_globals, **eval_locals}
+        thunk = eval(  # skipcq: PYL-W0123  # noqa: S307
+            _compile_eval(f"lambda: ({source})"),
+            namespace,
+        )
+        _THUNKS[key] = (eval_globals, eval_locals, thunk)
+    return _THUNKS[key][2]
 
 
 def test_invalid_sqltriplet() -> None:
@@ -57,42 +120,96 @@ def test_invalid_sqltriplet() -> None:
 
 def test_json_contains() -> None:
     """Test json_contains function."""
-    properties = json.dumps(SAMPLE_PROPERTIES)
-    assert json_contains(properties, "int")
+    assert json_contains(SAMPLE_PROPERTIES_JSON, "int")
     assert json_contains(json.dumps([1]), 1)
-    assert not json_contains(properties, "foo")
+    assert not json_contains(SAMPLE_PROPERTIES_JSON, "foo")
+
+
+@pytest.fixture(scope="module")
+def sqlite_con() -> Iterator[sqlite3.Connection]:
+    """Shared in-memory SQLite connection with the DSL regex function registered.
 
+    Connection setup and function registration are done once per module
+    rather than for every evaluated predicate.
 
-def sqlite_eval(query: str | Number) -> bool:
+    """
+    # Keep every distinct test statement in the prepared-statement cache.
+    con = sqlite3.connect(":memory:", cached_statements=512)
+    if logger.isEnabledFor(logging.DEBUG):
+        con.set_trace_callback(logger.debug)
+    # Skip journaling/sync bookkeeping: the database is throwaway.
+    con.executescript(
+        "PRAGMA journal_mode=MEMORY;"
+        "PRAGMA synchronous=OFF;"
+        "PRAGMA temp_store=MEMORY;"
+        "PRAGMA locking_mode=EXCLUSIVE;"
+        "PRAGMA cache_size=-2000;",
+    )
+    con.create_function("REGEXP", 2, py_regexp)
+    con.create_function("REGEXP", 3, py_regexp)
+    yield con
+    con.close()
+
+
+@pytest.fixture(scope="class")
+def check(request: pytest.FixtureRequest) -> Callable:
+    """Return the scenario check, binding `sqlite_eval` to the shared connection."""
+    if request.param is sqlite_eval:
+        return partial(sqlite_eval, con=request.getfixturevalue("sqlite_con"))
+    return request.param
+
+
+@lru_cache(maxsize=None)
+def _is_balanced(query: str) -> bool:
+    """Check (once per unique query) that brackets in an SQL query are balanced."""
+    parens_balanced = query.count("(") == query.count(")")
+    return parens_balanced and query.count("[") == query.count("]")
+
+
+def sqlite_eval(query: str | Number, con: sqlite3.Connection) -> bool:
     """Evaluate an SQL predicate on dummy data and return the result.
 
     Args:
         query (Union[str, Number]): SQL predicate to evaluate.
+        con (sqlite3.Connection): Connection to evaluate the predicate with.
 
     Returns:
         bool: Result of the evaluation.
 
     """
-    with sqlite3.connect(":memory:") as con:
-        con.create_function("REGEXP", 2, py_regexp)
-        con.create_function("REGEXP", 3, py_regexp)
-        con.create_function("LISTSUM", 1, json_list_sum)
-        con.create_function("CONTAINS", 1, json_contains)
-        cur = con.cursor()
-        cur.execute("CREATE TABLE test(properties TEXT)")
-        cur.execute(
-            "INSERT INTO test VALUES(:properties)",
-            {"properties": json.dumps(SAMPLE_PROPERTIES)},
-        )
-        con.commit()
-        if isinstance(query, str):
-            assert query.count("(") == query.count(")")
-            assert query.count("[") == query.count("]")
-        cur.execute(f"SELECT {query} FROM test")  # noqa: S608
-        (result,) = cur.fetchone()
+    if isinstance(query, str):
+        assert _is_balanced(query)
+    (result,) = con.execute(
+        f"SELECT {query} FROM (SELECT ? AS properties)",  # noqa: S608
+        (SAMPLE_PROPERTIES_JSON,),
+    ).fetchone()
     return result
 
 
+def sqlite_eval_batch(
+    queries: Sequence[str | Number],
+    con: sqlite3.Connection,
+) -> tuple:
+    """Evaluate several SQL predicates on dummy data in a single statement.
+
+    Each predicate becomes a column of one SELECT, so the statement is
+    prepared and stepped once for the whole batch.
+
+    Args:
+        queries (Sequence[Union[str, Number]]): SQL predicates to evaluate.
+        con (sqlite3.Connection): Connection to evaluate the predicates with.
+
+    Returns:
+        tuple: Result of each evaluation, in the order of `queries`.
+
+    """
+    columns = ", ".join(f"({query}) AS c{i}" for i, query in enumerate(queries))
+    return con.execute(
+        f"SELECT {columns} FROM (SELECT ? AS properties)",  # noqa: S608
+        (SAMPLE_PROPERTIES_JSON,),
+    ).fetchone()
+
+
 class TestSQLite:
     """Test converting from our DSL to an SQLite backend."""
 
@@ -100,7 +217,7 @@ class TestSQLite:
     def test_prop_or_prop() -> None:
         """Test OR operator between two prop accesses."""
         query = eval(  # skipcq: PYL-W0123  # noqa: S307
-            "(props['int'] == 2) | (props['int'] == 3)",
+            _compile_eval("(props['int'] == 2) | (props['int'] == 3)"),
             SQL_GLOBALS,
             {},
         )
@@ -109,16 +226,109 @@ class TestSQLite:
             '(json_extract(properties, "$.int") == 3))'
         )
 
+    @staticmethod
+    def test_binary_operations_batch(sqlite_con: sqlite3.Connection) -> None:
+        """Test evaluating all binary operations in one SELECT."""
+        queries = [
+            eval(  # skipcq: PYL-W0123  # noqa: S307
+                _compile_eval(f"props['int'] {op} 2"),
+                SQL_GLOBALS,
+                {"props": _PROPS_SQL},
+            )
+            for op in BINARY_OP_STRINGS
+        ]
+        results = sqlite_eval_batch(queries, sqlite_con)
+        assert results == tuple(sqlite_eval(query, sqlite_con) for query in queries)
+        assert all(isinstance(result, _NUMBER_TYPES) for result in results)
+
+    @staticmethod
+    def test_schema_cast(sqlite_con: sqlite3.Connection) -> None:
+        """Test schema hints cast numeric properties only."""
+        props = _PROPS_SQL_SCHEMA
+        assert str(props["int"]) == (
+            'CAST(json_extract(properties, "$.int") AS INTEGER)'
+        )
+        assert str(SQLJSONDictionary(schema={"x.y": float})["x"]["y"]) == (
+            'CAST(json_extract(properties, "$.x.y") AS REAL)'
+        )
+        assert str(props["list"]) == 'json_extract(properties, "$.list")'
+        assert str(props["string"]) == 'json_extract(properties, "$.string")'
+
+        # Cast properties evaluate like their uncast counterparts
+        queries = [
+            props["int"] + props["neg"],
+            props["int"] // 2,
+            props["int"] ** 2,
+            props["bool"] & (props["int"] == 2),
+            -props["neg"],
+        ]
+        expected = [1, 1, 4, 1, 1]
+        assert list(sqlite_eval_batch(queries, sqlite_con)) == expected
+
+    @staticmethod
+    def test_interned_children() -> None:
+        """Test repeated property accesses return the same child object."""
+        props = SQLJSONDictionary()
+        assert props["nesting"]["fib"][4] is props["nesting"]["fib"][4]
+        assert props["list"][1] is not props["list"][True]
+        assert str(props["list"][True]) == 'json_extract(properties, "$.list[True]")'
+
+    @staticmethod
+    def test_shared_root_not_interned() -> None:
+        """Test the shared SQL_GLOBALS root does not retain accessed keys."""
+        props = SQL_GLOBALS["props"]
+        assert props["foo"] is not props["foo"]
+        assert str(props["foo"]) == 'json_extract(properties, "$.foo")'
+        child = props["nesting"]
+        assert child["fib"] is child["fib"]
+
+    @staticmethod
+    def test_triplet_str_cached() -> None:
+        """Test SQLTriplet renders once and reuses the SQL string."""
+        query = (_PROPS_SQL["int"] == 2) | (_PROPS_SQL["int"] == 3)
+        rendered = str(query)
+        assert str(query) is rendered
+
+    @staticmethod
+    def test_list_sum(sqlite_con: sqlite3.Connection) -> None:
+        """Test list sum is evaluated with json_each."""
+        query = sql_list_sum(_PROPS_SQL["nesting"]["fib"])
+        assert "json_each" in str(query)
+        assert sqlite_eval(query, sqlite_con) == sum(
+            SAMPLE_PROPERTIES["nesting"]["fib"],
+        )
+        # A missing list is NULL, not an empty sum
+        assert sqlite_eval(sql_list_sum(_PROPS_SQL["missing"]), sqlite_con) is None
+
+    @staticmethod
+    def test_contains(sqlite_con: sqlite3.Connection) -> None:
+        """Test contains on lists and dicts is evaluated with json_each."""
+        list_prop = _PROPS_SQL["list"]
+        dict_prop = _PROPS_SQL["dict"]
+        assert "json_each" in str(SQLTriplet(list_prop, "contains", 1))
+        results = sqlite_eval_batch(
+            [
+                SQLTriplet(list_prop, "contains", 1),
+                SQLTriplet(list_prop, "contains", 42),
+                SQLTriplet(dict_prop, "contains", "a"),
+                SQLTriplet(dict_prop, "contains", 1),
+                SQLTriplet(_PROPS_SQL["missing"], "contains", 1),
+            ],
+            sqlite_con,
+        )
+        assert results == (1, 0, 1, 0, None)
+
 
 class TestPredicate:
     """Test predicate statments with various backends."""
 
+    scenario_fixtures: ClassVar[list[str]] = ["check"]
     scenarios: ClassVar[list[str, dict]] = [
         (
             "Python",
             {
                 "eval_globals": PY_GLOBALS,
-                "eval_locals": {"props": SAMPLE_PROPERTIES},
+                "eval_locals": {"props": _PROPS_PY},
                 "check": lambda x: x,
             },
         ),
@@ -126,91 +336,76 @@ class TestPredicate:
             "SQLite",
             {
                 "eval_globals": SQL_GLOBALS,
-                "eval_locals": {"props": SQLJSONDictionary()},
+                "eval_locals": {"props": _PROPS_SQL},
                 "check": sqlite_eval,
             },
         ),
     ]
 
     @staticmethod
+    @pytest.mark.parametrize("op", BINARY_OP_STRINGS)
     def test_number_binary_operations(
         eval_globals: dict[str, object],
         eval_locals: Mapping[str, object],
         check: Callable,
+        op: str,
     ) -> None:
         """Check that binary operations between ints does not error."""
-        for op in BINARY_OP_STRINGS:
-            query = f"2 {op} 2"
-            result = eval(  # skipcq: PYL-W0123  # noqa: S307
-                query,
-                eval_globals,
-                eval_locals,
-            )
-            assert isinstance(check(result), Number)
+        query = f"2 {op} 2"
+        result = _make_thunk(query, eval_globals, eval_locals)()
+        assert isinstance(check(result), _NUMBER_TYPES)
 
     @staticmethod
+    @pytest.mark.parametrize("op", BINARY_OP_STRINGS)
     def test_property_binary_operations(
         eval_globals: dict[str, object],
         eval_locals: Mapping[str, object],
         check: Callable,
+        op: str,
     ) -> None:
         """Check that binary operations between properties does not error."""
-        for op in BINARY_OP_STRINGS:
-            query = f"props['int'] {op} props['int']"
-            result = eval(  # skipcq: PYL-W0123  # noqa: S307
-                query,
-                eval_globals,
-                eval_locals,
-            )
-            assert isinstance(check(result), Number)
+        query = f"props['int'] {op} props['int']"
+        result = _make_thunk(query, eval_globals, eval_locals)()
+        assert isinstance(check(result), _NUMBER_TYPES)
 
     @staticmethod
+    @pytest.mark.parametrize("op", BINARY_OP_STRINGS)
     def test_r_binary_operations(
         eval_globals: dict[str, object],
         eval_locals: Mapping[str, object],
         check: Callable,
+        op: str,
     ) -> None:
         """Test right hand binary operations between numbers and properties."""
-        for op in BINARY_OP_STRINGS:
-            query = f"2 {op} props['int']"
-            result = eval(  # skipcq: PYL-W0123  # noqa: S307
-                query,
-                eval_globals,
-                eval_locals,
-            )
-            assert isinstance(check(result), Number)
+        query = f"2 {op} props['int']"
+        result = _make_thunk(query, eval_globals, eval_locals)()
+        assert isinstance(check(result), _NUMBER_TYPES)
 
     @staticmethod
+    @pytest.mark.parametrize("op", PREFIX_OP_STRINGS)
     def test_number_prefix_operations(
         eval_globals: dict[str, object],
         eval_locals: Mapping[str, object],
         check: Callable,
+        op: str,
     ) -> None:
         """Test prefix operations on numbers."""
-        for op in PREFIX_OP_STRINGS:
-            query = f"{op}1"
-            result = eval(  # skipcq: PYL-W0123  # noqa: S307
-                query,
-                eval_globals,
-                eval_locals,
-            )
-            assert isinstance(check(result), Number)
+        query = f"{op}1"
+        result = _make_thunk(query, eval_globals, eval_locals)()
+        assert isinstance(check(result), _NUMBER_TYPES)
 
     @staticmethod
+    @pytest.mark.parametrize("op", PREFIX_OP_STRINGS)
     def test_property_prefix_operations(
         eval_globals: dict[str, object],
         eval_locals: Mapping[str, object],
         check: Callable,
+        op: str,
     ) -> None:
         """Test prefix operations on properties."""
-        for op in PREFIX_OP_STRINGS:
-            query = f"{op}props['int']"
-            result = eval(  # skipcq: PYL-W0123  # noqa: S307
-                query,
-                eval_globals,
-                eval_locals,
-            )
-            assert isinstance(check(result), Number)
+        query = f"{op}props['int']"
+        result = _make_thunk(query, eval_globals, eval_locals)()
+        assert isinstance(check(result), _NUMBER_TYPES)
 
     @staticmethod
     def test_regex_nested_props(
@@ -220,11 +415,7 @@ class TestPredicate:
     ) -> None:
         """Test regex on nested properties."""
         query = "props['nesting']['fib'][4]"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert check(result) == 5
 
     @staticmethod
@@ -235,11 +426,7 @@ class TestPredicate:
     ) -> None:
         """Test regex on string properties."""
         query = "regexp('Hello', props['string'])"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert check(result) == "Hello"
 
     @staticmethod
@@ -250,11 +437,7 @@ class TestPredicate:
     ) -> None:
         """Test regex on string and string."""
         query = "regexp('Hello', 'Hello world!')"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert check(result) == "Hello"
 
     @staticmethod
@@ -265,11 +448,7 @@ class TestPredicate:
     ) -> None:
         """Test regex on property and string."""
         query = "regexp(props['string'], 'Hello world!')"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert check(result) == "Hello world!"
 
     @staticmethod
@@ -280,11 +459,7 @@ class TestPredicate:
     ) -> None:
         """Test regex with ignorecase flag."""
         query = "regexp('hello', props['string'], re.IGNORECASE)"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert check(result) == "Hello"
 
     @staticmethod
@@ -295,11 +470,7 @@ class TestPredicate:
     ) -> None:
         """Test regex with no match."""
         query = "regexp('Yello', props['string'])"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert check(result) is None
 
     @staticmethod
@@ -310,13 +481,20 @@ class TestPredicate:
     ) -> None:
         """Test has_key function."""
         query = "has_key(props, 'foo')"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert bool(check(result)) is False
 
+    @staticmethod
+    def test_has_key_null_value(
+        eval_globals: dict[str, object],
+        eval_locals: Mapping[str, object],
+        check: Callable,
+    ) -> None:
+        """Test has_key function for a key with a null value."""
+        query = "has_key(props, 'null')"
+        result = _make_thunk(query, eval_globals, eval_locals)()
+        assert bool(check(result)) is True
+
     @staticmethod
     def test_is_none(
         eval_globals: dict[str, object],
@@ -325,11 +503,7 @@ class TestPredicate:
     ) -> None:
         """Test is_none function."""
         query = "is_none(props['null'])"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert bool(check(result)) is True
 
     @staticmethod
@@ -340,11 +514,7 @@ class TestPredicate:
     ) -> None:
         """Test is_not_none function."""
         query = "is_not_none(props['int'])"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert bool(check(result)) is True
 
     @staticmethod
@@ -355,11 +525,7 @@ class TestPredicate:
     ) -> None:
         """Test nested has_key function."""
         query = "has_key(props['dict'], 'a')"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert bool(check(result)) is True
 
     @staticmethod
@@ -370,11 +536,7 @@ class TestPredicate:
     ) -> None:
         """Test sum function on a list."""
         query = "sum(props['list'])"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert check(result) == sum(SAMPLE_PROPERTIES["list"])
 
     @staticmethod
@@ -385,11 +547,7 @@ class TestPredicate:
     ) -> None:
         """Test abs function."""
         query = "abs(props['neg'])"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert check(result) == 1
 
     @staticmethod
@@ -400,11 +558,7 @@ class TestPredicate:
     ) -> None:
         """Test not operator."""
         query = "not props['bool']"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert bool(check(result)) is False
 
     @staticmethod
@@ -415,11 +569,7 @@ class TestPredicate:
     ) -> None:
         """Test props with int keys."""
         query = "props['list'][1]"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert check(result) == 1
 
     @staticmethod
@@ -430,11 +580,7 @@ class TestPredicate:
     ) -> None:
         """Test props.get function."""
         query = "is_none(props.get('foo'))"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert bool(check(result)) is True
 
     @staticmethod
@@ -445,11 +591,7 @@ class TestPredicate:
     ) -> None:
         """Test props.get function with default."""
         query = "props.get('foo', 42)"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert check(result) == 42
 
     @staticmethod
@@ -460,11 +602,7 @@ class TestPredicate:
     ) -> None:
         """Test in operator for list."""
         query = "1 in props.get('list')"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert bool(check(result)) is True
 
     @staticmethod
@@ -476,11 +614,7 @@ class TestPredicate:
         """Test has_key function with exception."""
         query = "has_key(1, 'a')"
         with pytest.raises(TypeError, match="(not iterable)|(Unsupported type)"):
-            _ = eval(  # skipcq: PYL-W0123  # noqa: S307
-                query,
-                eval_globals,
-                eval_locals,
-            )
+            _ = _make_thunk(query, eval_globals, eval_locals)()
 
     @staticmethod
     def test_logical_and(
@@ -490,11 +624,7 @@ class TestPredicate:
     ) -> None:
         """Test logical and operator."""
         query = "props['bool'] & is_none(props['null'])"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert bool(check(result)) is True
 
     @staticmethod
@@ -505,11 +635,7 @@ class TestPredicate:
     ) -> None:
         """Test logical or operator."""
         query = "props['bool'] | (props['int'] < 2)"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert bool(check(result)) is True
 
     @staticmethod
@@ -520,11 +646,7 @@ class TestPredicate:
     ) -> None:
         """Test nested logical operators."""
         query = "(props['bool'] | (props['int'] < 2)) & abs(props['neg'])"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert bool(check(result)) is True
 
     @staticmethod
@@ -535,11 +657,7 @@ class TestPredicate:
     ) -> None:
         """Test contains operator for list."""
         query = "1 in props['list']"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert bool(check(result)) is True
 
     @staticmethod
@@ -550,11 +668,7 @@ class TestPredicate:
     ) -> None:
         """Test contains operator for dict."""
         query = "'a' in props['dict']"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert bool(check(result)) is True
 
     @staticmethod
@@ -565,9 +679,5 @@ class TestPredicate:
     ) -> None:
         """Test contains operator for str."""
         query = "'Hello' in props['string']"
-        result = eval(  # skipcq: PYL-W0123  # noqa: S307
-            query,
-            eval_globals,
-            eval_locals,
-        )
+        result = _make_thunk(query, eval_globals, eval_locals)()
         assert bool(check(result)) is True
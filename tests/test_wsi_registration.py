@@ -5,6 +5,7 @@ import cv2
 import numpy as np
 import pytest
 
+from tiatoolbox.tools.registration import wsi_registration
 from tiatoolbox.tools.registration.wsi_registration import (
     AffineWSITransformer,
     DFBRegister,
@@ -25,17 +26,8 @@ def test_extract_features(dfbr_features: Path) -> None:
     """Test for CNN based feature extraction function."""
     # dfbr (deep feature based registration).
     dfbr = DFBRegister()
-    fixed_img = np.repeat(
-        np.expand_dims(
-            np.repeat(
-                np.expand_dims(np.arange(0, 64, 1, dtype=np.uint8), axis=1),
-                64,
-                axis=1,
-            ),
-            axis=2,
-        ),
-        3,
-        axis=2,
+    fixed_img = np.ascontiguousarray(
+        np.broadcast_to(np.arange(64, dtype=np.uint8)[:, None, None], (64, 64, 3)),
     )
     output = dfbr.extract_features(fixed_img, fixed_img)
     pool3_feat = output["block3_pool"][0, :].detach().numpy()
@@ -75,17 +67,8 @@ def test_feature_mapping(fixed_image: Path, moving_image: Path) -> None:
 def test_dfbr_features() -> None:
     """Test for feature input to feature_mapping function."""
     dfbr = DFBRegister()
-    fixed_img = np.repeat(
-        np.expand_dims(
-            np.repeat(
-                np.expand_dims(np.arange(0, 64, 1, dtype=np.uint8), axis=1),
-                64,
-                axis=1,
-            ),
-            axis=2,
-        ),
-        3,
-        axis=2,
+    fixed_img = np.ascontiguousarray(
+        np.broadcast_to(np.arange(64, dtype=np.uint8)[:, None, None], (64, 64, 3)),
     )
     features = dfbr.extract_features(fixed_img, fixed_img)
 
@@ -189,6 +172,53 @@ def test_prealignment_output(
     assert np.linalg.norm(expected - output) < 0.2
 
 
+def test_prealignment_coarse_sweep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the downscaled rotation sweep agrees with a full sweep."""
+    size = 1100
+    fixed_mask = np.zeros((size, size), dtype=np.uint8)
+    cv2.ellipse(fixed_mask, (550, 550), (360, 180), 20, 0, 360, 1, -1)
+    cv2.circle(fixed_mask, (360, 360), 110, 1, -1)
+    fixed_img = np.full((size, size), 230, dtype=np.uint8)
+    fixed_img[fixed_mask > 0] = 120
+
+    rotation = np.array([[-1, 0, size - 8], [0, -1, size + 4]], dtype=float)
+    moving_img = cv2.warpAffine(fixed_img, rotation, (size, size), borderValue=230)
+    moving_mask = cv2.warpAffine(fixed_mask, rotation, (size, size))
+
+    coarse, _, _, coarse_dice = prealignment(
+        fixed_img,
+        moving_img,
+        fixed_mask,
+        moving_mask,
+    )
+    monkeypatch.setattr(wsi_registration, "PREALIGNMENT_SWEEP_SIZE", size + 1)
+    full, _, _, full_dice = prealignment(
+        fixed_img,
+        moving_img,
+        fixed_mask,
+        moving_mask,
+    )
+    assert np.array_equal(coarse, full)
+    assert coarse_dice == full_dice
+    assert np.linalg.norm(coarse[:2, :2] - rotation[:, :2]) < 0.1
+
+
+def test_prealignment_thin_mask() -> None:
+    """Test prealignment of a mask too thin for the downscaled sweep."""
+    fixed_mask = np.zeros((3000, 4), dtype=np.uint8)
+    fixed_mask[100:2000, 1:3] = 1
+    fixed_img = np.full((3000, 4), 200, dtype=np.uint8)
+    fixed_img[fixed_mask > 0] = 100
+
+    _, _, _, dice_after = prealignment(
+        fixed_img,
+        fixed_img.copy(),
+        fixed_mask,
+        fixed_mask.copy(),
+    )
+    assert dice_after == 1.0
+
+
 def test_dice_overlap_range() -> None:
     """Test if the value of dice_overlap is within the range."""
     fixed_img = RNG.integers(20, size=(256, 256))
@@ -547,14 +577,20 @@ def test_bspline_transform(
     assert mask_overlap > 0.75
 
 
-def test_affine_wsi_transformer(sample_ome_tiff: Path) -> None:
+@pytest.fixture(scope="module")
+def ome_tiff_reader(sample_ome_tiff: Path) -> WSIReader:
+    """Open the sample ome-tiff once for all tests in this module."""
+    return WSIReader.open(input_img=sample_ome_tiff)
+
+
+def test_affine_wsi_transformer(ome_tiff_reader: WSIReader) -> None:
     """Test Affine WSI transformer."""
     test_locations = [(1001, 600), (1000, 500), (800, 701)]  # at base level 0
     resolution = 0
     size = (100, 100)
+    wsi_reader = ome_tiff_reader
 
     for location in test_locations:
-        wsi_reader = WSIReader.open(input_img=sample_ome_tiff)
         expected = wsi_reader.read_rect(
             location,
             size,
@@ -575,3 +611,41 @@ def test_affine_wsi_transformer(sample_ome_tiff: Path) -> None:
         expected = cv2.rotate(expected, cv2.ROTATE_90_CLOCKWISE)
 
         assert np.sum(expected - output) == 0
+
+
+def test_affine_wsi_transformer_translation(
+    sample_ome_tiff: Path,
+    ome_tiff_reader: WSIReader,
+) -> None:
+    """Test Affine WSI transformer with identity and translation transforms."""
+    location = (1000, 500)
+    wsi_reader = ome_tiff_reader
+
+    for size in [(100, 100), (101, 101)]:
+        expected = wsi_reader.read_rect(location, size, resolution=0, units="level")
+        tfm = AffineWSITransformer(sample_ome_tiff, np.eye(3))
+        output = tfm.read_rect(location, size, resolution=0, units="level")
+        assert np.array_equal(expected, output)
+
+        transform_level0 = np.array([[1, 0, 20], [0, 1, -30], [0, 0, 1]])
+        tfm = AffineWSITransformer(wsi_reader, transform_level0)
+        output = tfm.read_rect(
+            (location[0] + 20, location[1] - 30),
+            size,
+            resolution=0,
+            units="level",
+        )
+        assert np.array_equal(expected, output)
+
+        # A 90 degree rotation goes through the general path and must
+        # return the same shape, including for odd sizes.
+        transform_level0 = np.array(
+            [
+                [0, -1, location[0] + location[1] + size[1]],
+                [1, 0, location[1] - location[0]],
+                [0, 0, 1],
+            ],
+        )
+        tfm = AffineWSITransformer(wsi_reader, transform_level0)
+        output = tfm.read_rect(location, size, resolution=0, units="level")
+        assert output.shape == expected.shape
@@ -54,6 +54,12 @@ Compile options:
 
     - `//` (floor division)
 
+JSON functions:
+    List sum and contains are converted to subqueries over the JSON1
+    table-valued function `json_each`, so they run entirely within
+    SQLite. Note that SQLite does not allow subqueries in index
+    expressions.
+
 """
 from __future__ import annotations
 
@@ -61,8 +67,9 @@ import json
 import operator
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from numbers import Number
-from typing import Callable
+from typing import Callable, ClassVar, Mapping
 
 
 @dataclass
@@ -81,6 +88,7 @@ class SQLNone:
 class SQLExpression:
     """SQL expression base class."""
 
+    __slots__ = ()
     __hash__ = None
 
     def __repr__(self: SQLExpression) -> str:
@@ -199,6 +207,9 @@ class SQLExpression:
 class SQLTriplet(SQLExpression):
     """Representation of an SQL triplet expression (LHS, operator, RHS).
 
+    Triplets are treated as immutable: the SQL string is rendered on the
+    first call to `str` and reused afterwards.
+
     Attributes:
         lhs (SQLExpression): Left hand side of expression.
         op (str): Operator string.
@@ -216,6 +227,7 @@ class SQLTriplet(SQLExpression):
         self.lhs = lhs
         self.op = op
         self.rhs = rhs
+        self._str = None
         self.formatters = {
             operator.mul: lambda a, b: f"({a} * {b})",
             operator.gt: lambda a, b: f"({a} > {b})",
@@ -237,14 +249,32 @@ class SQLTriplet(SQLExpression):
             operator.mod: lambda a, b: f"({a} % {b})",
             "is_none": lambda a, _: f"({a} IS NULL)",
             "is_not_none": lambda a, _: f"({a} IS NOT NULL)",
-            "list_sum": lambda a, _: f"LISTSUM({a})",
+            # json_type is NULL only for missing keys (not for JSON null).
+            "has_key": lambda d, _: f"(json_type(properties, {d.path}) IS NOT NULL)",
+            # A missing (NULL) operand stays NULL rather than summing to 0.
+            "list_sum": lambda a, _: (
+                f"(SELECT CASE WHEN {a} IS NULL THEN NULL "  # noqa: S608
+                f"ELSE IFNULL(SUM(value), 0) END FROM json_each({a}))"
+            ),
             "if_null": lambda x, d: f"IFNULL({x}, {d})",
-            "contains": lambda j, o: f"CONTAINS({j}, {o})",
+            # Object keys are text, array keys are integer indexes. A missing
+            # (NULL) container gives NULL rather than "not contained".
+            "contains": lambda j, o: (
+                f"(CASE WHEN {j} IS NULL THEN NULL ELSE ({o} IN "  # noqa: S608
+                "(SELECT CASE WHEN typeof(key) = 'text' "
+                f"THEN key ELSE value END FROM json_each({j}))) END)"
+            ),
             "bool": lambda x, _: f"({x} != 0)",
         }
 
     def __str__(self: SQLExpression) -> str:
         """Return a human-readable, or informal, string representation of an object."""
+        if self._str is None:
+            self._str = self._render()
+        return self._str
+
+    def _render(self: SQLExpression) -> str:
+        """Render the triplet, and recursively its operands, as SQL."""
         lhs = self.lhs
         rhs = self.rhs
         if isinstance(rhs, str):
@@ -257,22 +287,91 @@ class SQLTriplet(SQLExpression):
 
 
 class SQLJSONDictionary(SQLExpression):
-    """Representation of an SQL expression to access JSON properties."""
+    """Representation of an SQL expression to access JSON properties.
+
+    Args:
+        acc (str):
+            JSON path (without the leading `$.`) of the accessed property.
+        schema (Mapping[str, type]):
+            Optional mapping from property paths (e.g. `"nesting.fib[4]"`)
+            to their python types. Properties known to be `int` (including
+            `bool`) or `float` are wrapped in a `CAST` so that SQLite can
+            use typed comparisons instead of coercing at runtime.
+        intern_children (bool):
+            Whether to intern the children accessed from this object.
+            Disable this for long-lived roots shared between unrelated
+            queries, so that they do not keep every accessed key alive.
+
+    """
+
+    __slots__ = ("acc", "schema", "_sql", "_children")
+
+    _SQL_TYPES: ClassVar[dict[type, str]] = {int: "INTEGER", float: "REAL"}
 
-    def __init__(self: SQLJSONDictionary, acc: str | None = None) -> None:
+    def __init__(
+        self: SQLJSONDictionary,
+        acc: str | None = None,
+        schema: Mapping[str, type] | None = None,
+        *,
+        intern_children: bool = True,
+    ) -> None:
         """Initialize :class:`SQLJSONDictionary`."""
         self.acc = acc or ""
+        self.schema = schema
+        self._sql = None
+        self._children = {} if intern_children else None
 
     def __str__(self: SQLJSONDictionary) -> str:
         """Return a human-readable, or informal, string representation of an object."""
-        return f"json_extract(properties, {json.dumps(f'$.{self.acc}')})"
+        if self._sql is None:
+            sql = f"json_extract(properties, {self.path})"
+            sql_type = self._sql_type()
+            self._sql = f"CAST({sql} AS {sql_type})" if sql_type else sql
+        return self._sql
+
+    def _sql_type(self: SQLJSONDictionary) -> str | None:
+        """Return the SQL type to cast to from the schema, if any."""
+        if not self.schema:
+            return None
+        py_type = self.schema.get(self.acc)
+        for base, sql_type in self._SQL_TYPES.items():
+            if isinstance(py_type, type) and issubclass(py_type, base):
+                return sql_type
+        return None
+
+    @property
+    def path(self: SQLJSONDictionary) -> str:
+        """Return the quoted JSON path to the accessed property."""
+        return json.dumps(f"$.{self.acc}")
 
     def __getitem__(self: SQLJSONDictionary, key: str) -> SQLJSONDictionary:
-        """Get an item from the dataset."""
-        key_str = f"[{key}]" if isinstance(key, (int,)) else str(key)
-
-        joiner = "." if self.acc and not isinstance(key, int) else ""
-        return SQLJSONDictionary(acc=self.acc + joiner + f"{key_str}")
+        """Get an item from the dataset.
+
+        Children are interned per parent (unless disabled on a root), so
+        repeated accesses to the same path return the same (immutable)
+        object.
+
+        """
+        # Include the type so that e.g. True and 1 are not conflated.
+        cache_key = (type(key), key)
+        children = self._children
+        if children is not None and cache_key in children:
+            return children[cache_key]
+        if isinstance(key, int):
+            acc = f"{self.acc}[{key}]"
+        elif self.acc:
+            acc = f"{self.acc}.{key}"
+        else:
+            acc = str(key)
+        # Skip __init__ and set the slots directly.
+        child = SQLJSONDictionary.__new__(type(self))
+        child.acc = acc
+        child.schema = self.schema
+        child._sql = None  # noqa: SLF001
+        child._children = {}  # noqa: SLF001
+        if children is not None:
+            children[cache_key] = child
+        return child
 
     def get(
         self: SQLJSONDictionary,
@@ -326,9 +425,15 @@ def py_is_not_none(x: object) -> bool:
     return x is not None
 
 
+@lru_cache(maxsize=512)
+def _compile_regexp(pattern: str, flags: int) -> re.Pattern:
+    """Compile a regex pattern, caching the result by pattern and flags."""
+    return re.compile(pattern, flags=flags)
+
+
 def py_regexp(pattern: str, string: str, flags: int = 0) -> str | None:
     """Check if string matches pattern."""
-    reg = re.compile(pattern, flags=flags)
+    reg = _compile_regexp(pattern, int(flags))
     match = reg.search(string)
     if match:
         return match[0]
@@ -338,6 +443,10 @@ def py_regexp(pattern: str, string: str, flags: int = 0) -> str | None:
 def json_list_sum(json_list: str) -> Number:
     """Return the sum of a list of numbers in a JSON string.
 
+    Registered as the SQLite `LISTSUM` function for SQL written by
+    earlier versions. SQL generated from the DSL uses the native
+    `json_each` table-valued function instead (see :class:`SQLTriplet`).
+
     Args:
         json_list: JSON string containing a list of numbers.
 
@@ -352,6 +461,10 @@ def json_list_sum(json_list: str) -> Number:
 def json_contains(json_str: str, x: object) -> bool:
     """Return True if a JSON string contains x.
 
+    Registered as the SQLite `CONTAINS` function for SQL written by
+    earlier versions. SQL generated from the DSL uses the native
+    `json_each` table-valued function instead (see :class:`SQLTriplet`).
+
     Args:
         json_str: JSON string.
         x: Value to search for.
@@ -418,7 +531,7 @@ def sql_has_key(dictionary: SQLJSONDictionary, key: str | int) -> SQLTriplet:
     if not isinstance(dictionary, (SQLJSONDictionary,)):
         msg = "Unsupported type for has_key."
         raise TypeError(msg)
-    return SQLTriplet(dictionary[key], "is_not_none")
+    return SQLTriplet(dictionary[key], "has_key")
 
 
 # Constants defining the global variables for use in eval() when
@@ -430,7 +543,8 @@ _COMMON_GLOBALS = {
 }
 SQL_GLOBALS = {
     "__builtins__": {**_COMMON_GLOBALS["__builtins__"], "sum": sql_list_sum},
-    "props": SQLJSONDictionary(),
+    # Shared by every query, so children are only interned below the root.
+    "props": SQLJSONDictionary(intern_children=False),
     "is_none": sql_is_none,
     "is_not_none": sql_is_not_none,
     "regexp": SQLRegex.search,
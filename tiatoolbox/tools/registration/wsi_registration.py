@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import itertools
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import cv2
@@ -10,6 +11,7 @@ import SimpleITK as sitk  # noqa: N813
 import torch
 import torchvision
 from numpy.linalg import inv
+from scipy.spatial import distance
 from skimage import exposure, filters
 from skimage.registration import phase_cross_correlation
 from skimage.util import img_as_float
@@ -18,14 +20,19 @@ from torchvision.models import VGG16_Weights
 from tiatoolbox import logger
 from tiatoolbox.tools.patchextraction import PatchExtractor
 from tiatoolbox.utils.metrics import dice
+from tiatoolbox.utils.misc import select_device
 from tiatoolbox.utils.transforms import imresize
 from tiatoolbox.wsicore.wsireader import VirtualWSIReader, WSIReader
 
 if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+
     from tiatoolbox.typing import IntBounds, Resolution, Units
 
 RGB_IMAGE_DIM = 3
 BIN_MASK_DIM = 2
+PREALIGNMENT_SWEEP_SIZE = 512
+PREALIGNMENT_NUM_CANDIDATES = 3
 
 
 def _check_dims(
@@ -126,6 +133,69 @@ def apply_affine_transformation(
     )
 
 
+def _rotation_search_dice(
+    fixed_mask: np.ndarray,
+    moving_mask: np.ndarray,
+    transforms: np.ndarray,
+) -> np.ndarray:
+    """Compute Dice between a fixed mask and transformed copies of a moving mask.
+
+    Args:
+        fixed_mask (:class:`numpy.ndarray`):
+            A binary (`uint8`) tissue mask for the fixed image.
+        moving_mask (:class:`numpy.ndarray`):
+            A binary (`uint8`) tissue mask for the moving image.
+        transforms (:class:`numpy.ndarray`):
+            An array of shape Nx3x3 containing the rigid transforms to apply
+            to the moving mask.
+
+    Returns:
+        :class:`numpy.ndarray`:
+            Dice overlap for each of the N transforms.
+
+    """
+    return np.array(
+        [
+            dice(
+                fixed_mask,
+                cv2.warpAffine(moving_mask, transform[0:-1][:], fixed_mask.shape[::-1]),
+            )
+            for transform in transforms
+        ],
+    )
+
+
+def _downscale_mask(mask: np.ndarray, scale: int) -> np.ndarray:
+    """Downscale a binary (`uint8`) mask by an integer factor.
+
+    The mask is cropped to a multiple of `scale` so that every output
+    pixel covers exactly `scale` x `scale` input pixels, and an output
+    pixel is set if at least half of the pixels it covers are set.
+
+    """
+    height, width = (mask.shape[0] // scale) * scale, (mask.shape[1] // scale) * scale
+    mask = cv2.resize(
+        mask[:height, :width].astype(np.float32),
+        (width // scale, height // scale),
+        interpolation=cv2.INTER_AREA,
+    )
+    return np.uint8(mask >= 0.5)  # noqa: PLR2004
+
+
+def _downscale_transforms(transforms: np.ndarray, scale: int) -> np.ndarray:
+    """Express Nx3x3 transforms in the pixel grid of :func:`_downscale_mask`."""
+    offset = (scale - 1) / 2
+    to_low = np.array(
+        [
+            [1 / scale, 0, -offset / scale],
+            [0, 1 / scale, -offset / scale],
+            [0, 0, 1],
+        ],
+    )
+    to_high = inv(to_low)
+    return to_low @ transforms @ to_high
+
+
 def prealignment(
     fixed_img: np.ndarray,
     moving_img: np.ndarray,
@@ -138,6 +208,8 @@ def prealignment(
 
     This function performs initial alignment of a moving image with respect to a
     fixed image. This can be used as a prealignment step before final refinement.
+    For large masks, the rotation angles are first ranked on downscaled masks and
+    only the best few are scored at full resolution.
 
     Args:
         fixed_img (:class:`numpy.ndarray`):
@@ -224,7 +296,6 @@ def prealignment(
     origin_transform_com_ = [[1, 0, -fixed_com[0]], [0, 1, -fixed_com[1]], [0, 0, 1]]
     origin_transform_com = [[1, 0, fixed_com[0]], [0, 1, fixed_com[1]], [0, 0, 1]]
 
-    all_dice = []
     all_transform = []
     for angle in np.arange(0, 360, rotation_step).tolist():
         theta = np.radians(angle)
@@ -238,21 +309,33 @@ def prealignment(
             ),
             com_transform,
         )
+        all_transform.append(transform)
 
-        # Apply transformation
-        warped_moving_mask = cv2.warpAffine(
-            moving_mask,
-            transform[0:-1][:],
-            fixed_img.shape[:2][::-1],
+    all_transform = np.stack(all_transform)
+    candidates = np.arange(len(all_transform))
+    scale = max(fixed_mask.shape) // PREALIGNMENT_SWEEP_SIZE
+    # The masks are padded to a common shape above, so a side shorter than
+    # `scale` would downscale to nothing; keep the full sweep in that case.
+    if scale > 1 and min(fixed_mask.shape) >= scale:
+        # Sweep all angles on downscaled masks and only score the best few
+        # at full resolution.
+        coarse_dice = _rotation_search_dice(
+            _downscale_mask(fixed_mask, scale),
+            _downscale_mask(moving_mask, scale),
+            _downscale_transforms(all_transform, scale),
         )
-        dice_com = dice(fixed_mask, warped_moving_mask)
-
-        all_dice.append(dice_com)
-        all_transform.append(transform)
+        candidates = np.sort(
+            np.argsort(-coarse_dice, kind="stable")[:PREALIGNMENT_NUM_CANDIDATES],
+        )
+    all_dice = _rotation_search_dice(
+        fixed_mask,
+        moving_mask,
+        all_transform[candidates],
+    ).tolist()
 
     if max(all_dice) >= dice_overlap:
         dice_after = max(all_dice)
-        pre_transform = all_transform[all_dice.index(dice_after)]
+        pre_transform = all_transform[candidates[all_dice.index(dice_after)]]
 
         # Apply transformation to both image and mask
         moving_img = apply_affine_transformation(
@@ -271,6 +354,51 @@ def prealignment(
     return np.eye(3), orig_moving_img, moving_mask, dice_before
 
 
+def _match_histogram(source: np.ndarray, reference: np.ndarray) -> np.ndarray:
+    """Match the histogram of a grayscale image to that of a reference image.
+
+    For 8-bit images, this is equivalent to
+    :func:`skimage.exposure.match_histograms` followed by casting to
+    `uint8`, but computed as a 256-entry lookup table from
+    :func:`numpy.bincount` histograms. Other images fall back to
+    scikit-image.
+
+    Args:
+        source (:class:`numpy.ndarray`):
+            A grayscale image to transform.
+        reference (:class:`numpy.ndarray`):
+            A grayscale reference image.
+
+    Returns:
+        :class:`numpy.ndarray`:
+            The transformed `source` image of type `uint8`.
+
+    """
+    if not (_fits_uint8(source) and _fits_uint8(reference)):
+        return exposure.match_histograms(source, reference).astype(np.uint8)
+
+    source = np.ascontiguousarray(source, dtype=np.uint8)
+    src_counts = np.bincount(source.ravel(), minlength=256)
+    ref_counts = np.bincount(
+        np.ascontiguousarray(reference, dtype=np.uint8).ravel(),
+        minlength=256,
+    )
+    ref_values = np.nonzero(ref_counts)[0]
+    src_quantiles = np.cumsum(src_counts) / source.size
+    ref_quantiles = np.cumsum(ref_counts[ref_values]) / reference.size
+    lut = np.interp(src_quantiles, ref_quantiles, ref_values).astype(np.uint8)
+    return lut[source]
+
+
+def _fits_uint8(image: np.ndarray) -> bool:
+    """Check if an integer image can be represented as `uint8` without loss."""
+    if image.dtype == np.uint8:
+        return True
+    if image.dtype.kind not in "iu" or image.size == 0:
+        return False
+    return image.min() >= 0 and image.max() <= np.iinfo(np.uint8).max
+
+
 def match_histograms(
     image_a: np.ndarray,
     image_b: np.ndarray,
@@ -312,9 +440,9 @@ def match_histograms(
         kernel,
     )
     if np.mean(entropy_a) > np.mean(entropy_b):
-        image_b = exposure.match_histograms(image_b, image_a).astype(np.uint8)
+        image_b = _match_histogram(image_b, image_a)
     else:
-        image_a = exposure.match_histograms(image_a, image_b).astype(np.uint8)
+        image_a = _match_histogram(image_a, image_b)
 
     return image_a, image_b
 
@@ -333,55 +461,20 @@ class DFBRFeatureExtractor(torch.nn.Module):
         super().__init__()
         output_layers_id: list[str] = ["16", "23", "30"]
         output_layers_key: list[str] = ["block3_pool", "block4_pool", "block5_pool"]
-        self.features: dict = dict.fromkeys(output_layers_key, None)
+        self.output_layers: dict[str, str] = dict(
+            zip(output_layers_id, output_layers_key),
+        )
         self.pretrained: torch.nn.Sequential = torchvision.models.vgg16(
             weights=VGG16_Weights.IMAGENET1K_V1,
         ).features
-        self.f_hooks = [
-            getattr(self.pretrained, layer).register_forward_hook(
-                self.forward_hook(output_layers_key[i]),
-            )
-            for i, layer in enumerate(output_layers_id)
-        ]
-
-    def forward_hook(self: torch.nn.Module, layer_name: str) -> None:
-        """Register a hook.
-
-        Args:
-            layer_name (str):
-                User-defined name for a layer.
-
-        Returns:
-            None
-
-        """
-
-        def hook(
-            _module: torch.nn.MaxPool2d,
-            _module_input: tuple[torch.Tensor],
-            module_output: torch.Tensor,
-        ) -> None:
-            """Forward hook for feature extraction.
-
-            Args:
-                _module:
-                    Unused argument for the module.
-                _module_input:
-                    Unused argument for the modules' input.
-                module_output (torch.Tensor):
-                    Output (features) of the module.
-
-            Returns:
-                None
-
-            """
-            self.features[layer_name] = module_output
-
-        return hook
 
     def forward(self: torch.nn.Module, x: torch.Tensor) -> dict[str, torch.Tensor]:
         """Forward pass for feature extraction.
 
+        The layers are run one by one and the outputs of the pooling layers
+        are collected in a dictionary local to the call, so one extractor
+        can safely be shared by concurrent callers.
+
         Args:
             x (torch.Tensor):
                 Batch of input images.
@@ -392,8 +485,30 @@ class DFBRFeatureExtractor(torch.nn.Module):
                 The expected format is {layer_name: features}.
 
         """
-        _ = self.pretrained(x)
-        return self.features
+        features = {}
+        for layer_id, layer in self.pretrained.named_children():
+            x = layer(x)
+            if layer_id in self.output_layers:
+                features[self.output_layers[layer_id]] = x
+        return features
+
+
+@lru_cache(maxsize=None)
+def _get_feature_extractor(device: str = "cpu") -> DFBRFeatureExtractor:
+    """Return the shared, frozen :class:`DFBRFeatureExtractor` for a device.
+
+    Loading the pretrained VGG16 weights dominates the cost of creating
+    a :class:`DFBRegister`, so the extractor is created once per process
+    (and device) and shared by all instances.
+
+    Args:
+        device (str):
+            Device to place the extractor on, e.g. "cpu" or "cuda".
+
+    """
+    feature_extractor = DFBRFeatureExtractor().eval()
+    feature_extractor.requires_grad_(requires_grad=False)
+    return feature_extractor.to(device)
 
 
 class DFBRegister:
@@ -426,11 +541,26 @@ class DFBRegister:
 
     """
 
-    def __init__(self: DFBRegister, patch_size: tuple[int, int] = (224, 224)) -> None:
-        """Initialize :class:`DFBRegister`."""
+    def __init__(
+        self: DFBRegister,
+        patch_size: tuple[int, int] = (224, 224),
+        *,
+        on_gpu: bool = False,
+    ) -> None:
+        """Initialize :class:`DFBRegister`.
+
+        Args:
+            patch_size (tuple(int)):
+                Size of the images given to the feature extractor.
+            on_gpu (bool):
+                Whether to extract features on the GPU. On the GPU, the
+                feature extractor runs in half precision.
+
+        """
         self.patch_size = patch_size
         self.x_scale, self.y_scale = [], []
-        self.feature_extractor = DFBRFeatureExtractor()
+        self.device = select_device(on_gpu=on_gpu)
+        self.feature_extractor = _get_feature_extractor(self.device)
 
     # Make this function private when full pipeline is implemented.
     def extract_features(
@@ -468,18 +598,20 @@ class DFBRegister:
             interpolation="linear",
         )
 
-        fixed_cnn = fixed_cnn / 255.0
-        moving_cnn = moving_cnn / 255.0
-
-        fixed_cnn = np.moveaxis(fixed_cnn, -1, 0)
-        moving_cnn = np.moveaxis(moving_cnn, -1, 0)
+        # Both images go through the network as a single NCHW batch of two
+        cnn_input = np.stack((fixed_cnn, moving_cnn)).astype(np.float32)
+        cnn_input /= 255.0
+        cnn_input = np.ascontiguousarray(np.moveaxis(cnn_input, -1, 1))
 
-        fixed_cnn = np.expand_dims(fixed_cnn, axis=0)
-        moving_cnn = np.expand_dims(moving_cnn, axis=0)
-        cnn_input = np.concatenate((fixed_cnn, moving_cnn), axis=0)
-
-        x = torch.from_numpy(cnn_input).type(torch.float32)
-        return self.feature_extractor(x)
+        x = torch.from_numpy(cnn_input).to(self.device)
+        with torch.inference_mode(), torch.autocast(
+            device_type=self.device,
+            dtype=torch.float16,
+            enabled=self.device == "cuda",
+        ):
+            features = self.feature_extractor(x)
+        # Features are returned as float32 CPU tensors regardless of device.
+        return {key: value.float().cpu() for key, value in features.items()}
 
     @staticmethod
     def finding_match(feature_dist: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
@@ -501,11 +633,9 @@ class DFBRegister:
         """
         seq = np.arange(feature_dist.shape[0])
         ind_first_min = np.argmin(feature_dist, axis=1)
-        first_min = feature_dist[seq, ind_first_min]
-        mask = np.zeros_like(feature_dist)
-        mask[seq, ind_first_min] = 1
-        masked = np.ma.masked_array(feature_dist, mask)
-        second_min = np.amin(masked, axis=1)
+        # The two smallest distances per row, without sorting the whole row
+        two_min = np.partition(feature_dist, 1, axis=1)
+        first_min, second_min = two_min[:, 0], two_min[:, 1]
         return np.array([seq, ind_first_min]).transpose(), np.array(
             second_min / first_min,
         )
@@ -535,34 +665,14 @@ class DFBRegister:
                 A feature distance array.
 
         """
-        feature_distance = np.linalg.norm(
-            np.repeat(np.expand_dims(features_x, axis=0), features_y.shape[0], axis=0)
-            - np.repeat(
-                np.expand_dims(features_y, axis=1),
-                features_x.shape[0],
-                axis=1,
-            ),
-            axis=len(features_x.shape),
-        )
+        feature_distance = distance.cdist(features_y, features_x)
 
         feature_size_2d = np.int_(np.sqrt(feature_distance.shape[0]))
-        ref_feature_size_2d = factor * feature_size_2d
-        feature_size, ref_feature_size = feature_size_2d**2, ref_feature_size_2d**2
         feature_grid = np.kron(
-            np.arange(feature_size).reshape([feature_size_2d, feature_size_2d]),
+            np.arange(feature_size_2d**2).reshape([feature_size_2d, feature_size_2d]),
             np.ones([factor, factor], dtype="int32"),
-        )
-        row_ind = np.repeat(
-            feature_grid.reshape([ref_feature_size, 1]),
-            ref_feature_size,
-            axis=1,
-        )
-        col_ind = np.repeat(
-            feature_grid.reshape([1, ref_feature_size]),
-            ref_feature_size,
-            axis=0,
-        )
-        return feature_distance[row_ind, col_ind]
+        ).ravel()
+        return feature_distance[np.ix_(feature_grid, feature_grid)]
 
     def feature_mapping(
         self: DFBRegister,
@@ -789,6 +899,29 @@ class DFBRegister:
             mask.shape[::-1],
         )
 
+    @staticmethod
+    def _unique_points_mask(points: np.ndarray) -> np.ndarray:
+        """Return a boolean mask of points which occur only once.
+
+        Args:
+            points (:class:`numpy.ndarray`):
+                (N, 2) array of point coordinates.
+
+        Returns:
+            :class:`numpy.ndarray`:
+                (N,) boolean array, False for every copy of a repeated point.
+
+        """
+        if len(points) == 0:
+            return np.ones(0, dtype=bool)
+        _, inverse, count = np.unique(
+            points,
+            axis=0,
+            return_inverse=True,
+            return_counts=True,
+        )
+        return count[inverse.ravel()] == 1
+
     def filtering_matching_points(
         self: DFBRegister,
         fixed_mask: np.ndarray,
@@ -841,36 +974,13 @@ class DFBRegister:
         )
 
         # remove duplicate matching points
-        duplicate_ind = []
-        unq, count = np.unique(fixed_matched_points, axis=0, return_counts=True)
-        repeated_points = unq[count > 1]
-        for repeated_point in repeated_points:
-            repeated_idx = np.argwhere(
-                np.all(fixed_matched_points == repeated_point, axis=1),
-            )
-            duplicate_ind = np.hstack([duplicate_ind, repeated_idx.ravel()])
-
-        unq, count = np.unique(moving_matched_points, axis=0, return_counts=True)
-        repeated_points = unq[count > 1]
-        for repeated_point in repeated_points:
-            repeated_idx = np.argwhere(
-                np.all(moving_matched_points == repeated_point, axis=1),
-            )
-            duplicate_ind = np.hstack([duplicate_ind, repeated_idx.ravel()])
-
-        if len(duplicate_ind) > 0:
-            duplicate_ind = duplicate_ind.astype(int)
-            fixed_matched_points = np.delete(
-                fixed_matched_points,
-                duplicate_ind,
-                axis=0,
-            )
-            moving_matched_points = np.delete(
-                moving_matched_points,
-                duplicate_ind,
-                axis=0,
-            )
-            quality = np.delete(quality, duplicate_ind)
+        unique_mask = self._unique_points_mask(
+            fixed_matched_points,
+        ) & self._unique_points_mask(moving_matched_points)
+        if not np.all(unique_mask):
+            fixed_matched_points = fixed_matched_points[unique_mask]
+            moving_matched_points = moving_matched_points[unique_mask]
+            quality = quality[unique_mask]
 
         return fixed_matched_points, moving_matched_points, quality
 
@@ -1229,6 +1339,13 @@ class DFBRegister:
         return image_transform @ transform_initializer
 
 
+def _apply_mask_inplace(image: np.ndarray, mask: np.ndarray) -> None:
+    """Set pixels of an image outside a binary (`uint8`) mask to zero in place."""
+    if image.ndim == RGB_IMAGE_DIM:
+        mask = mask[:, :, np.newaxis]
+    np.multiply(image, mask, out=image)
+
+
 def estimate_bspline_transform(
     fixed_image: np.ndarray,
     moving_image: np.ndarray,
@@ -1332,16 +1449,13 @@ def estimate_bspline_transform(
         fixed_mask = fixed_mask[:, :, 0]
     if len(moving_mask.shape) > BIN_MASK_DIM:
         moving_mask = moving_mask[:, :, 0]
-    fixed_mask = np.array(fixed_mask != 0, dtype=np.uint8)
-    moving_mask = np.array(moving_mask != 0, dtype=np.uint8)
-
-    # Background Removal
-    fixed_image_inv = cv2.bitwise_and(fixed_image_inv, fixed_image_inv, mask=fixed_mask)
-    moving_image_inv = cv2.bitwise_and(
-        moving_image_inv,
-        moving_image_inv,
-        mask=moving_mask,
-    )
+    # A boolean array shares the layout of uint8, so viewing avoids a copy
+    fixed_mask = np.not_equal(fixed_mask, 0).view(np.uint8)
+    moving_mask = np.not_equal(moving_mask, 0).view(np.uint8)
+
+    # Background Removal, in place on the freshly inverted images
+    _apply_mask_inplace(fixed_image_inv, fixed_mask)
+    _apply_mask_inplace(moving_image_inv, moving_mask)
 
     # Getting SimpleITK Images from numpy arrays
     fixed_image_inv_sitk = sitk.GetImageFromArray(fixed_image_inv, isVector=True)
@@ -1453,20 +1567,77 @@ class AffineWSITransformer:
 
     def __init__(
         self: AffineWSITransformer,
-        reader: WSIReader,
+        reader: str | Path | WSIReader,
         transform: np.ndarray,
     ) -> None:
         """Initialize object.
 
         Args:
-            reader (WSIReader):
-                An object with base WSIReader as base class.
+            reader (str, Path or WSIReader):
+                An object with base WSIReader as base class, or the path to
+                a whole slide image to open with :func:`WSIReader.open`.
             transform (:class:`numpy.ndarray`):
                 A 3x3 transformation matrix. The inverse transformation will be applied.
 
         """
-        self.wsi_reader = reader
+        self.wsi_reader = WSIReader.open(reader)
         self.transform_level0 = transform
+        self._permutation = self._signed_permutation(transform[:2, :2])
+        self._translation = self._integer_translation(transform)
+
+    @staticmethod
+    def _integer_translation(transform: np.ndarray) -> tuple[int, int] | None:
+        """Return the translation of a transformation if it is an integer shift.
+
+        Identity and integer translations move whole pixels, so regions can
+        be read directly from the shifted location without resampling.
+
+        Args:
+            transform (:class:`numpy.ndarray`):
+                A 3x3 transformation matrix.
+
+        Returns:
+            tuple(int) or None:
+                The (x, y) translation, or None if the transformation is not
+                a pure integer translation.
+
+        """
+        translation = transform[:2, 2]
+        if not (
+            np.array_equal(transform[:2, :2], np.eye(2))
+            and np.array_equal(transform[2], [0, 0, 1])
+            and np.array_equal(translation, np.rint(translation))
+        ):
+            return None
+        return int(translation[0]), int(translation[1])
+
+    @staticmethod
+    def _signed_permutation(matrix: np.ndarray) -> np.ndarray | None:
+        """Return a 2x2 matrix as integers if it is a signed permutation matrix.
+
+        Signed permutation matrices (e.g. rotations by multiples of 90
+        degrees and flips) map pixel centres exactly onto pixel centres,
+        so they can be applied by reindexing instead of interpolation.
+
+        Args:
+            matrix (:class:`numpy.ndarray`):
+                A 2x2 matrix.
+
+        Returns:
+            :class:`numpy.ndarray` or None:
+                The integer matrix, or None if it is not a signed permutation.
+
+        """
+        rounded = np.rint(matrix)
+        if not np.array_equal(matrix, rounded):
+            return None
+        rounded = rounded.astype(int)
+        magnitude = np.abs(rounded)
+        if not (
+            np.all(magnitude.sum(axis=0) == 1) and np.all(magnitude.sum(axis=1) == 1)
+        ):
+            return None
+        return rounded
 
     @staticmethod
     def transform_points(points: np.ndarray, transform: np.ndarray) -> np.ndarray:
@@ -1603,14 +1774,50 @@ class AffineWSITransformer:
                 A transformed region/patch.
 
         """
+        height, width = patch.shape[:2]
+        if self._permutation is not None and size[0] == size[1] == width == height:
+            # Rotation about the centre of a square patch is an exact reindexing.
+            return self._permute_patch(patch)
+
+        transform = self._patch_transform(size)
+        return cv2.warpAffine(patch, transform[0:-1][:], patch.shape[:2][::-1])
+
+    def _patch_transform(
+        self: AffineWSITransformer,
+        size: tuple[int, int],
+    ) -> np.ndarray:
+        """Return the transformation (without translation) about the patch centre."""
         transform = self.transform_level0 * [[1, 1, 0], [1, 1, 0], [1, 1, 1]]
         translation = (-size[0] / 2 + 0.5, -size[1] / 2 + 0.5)
         forward_translation = np.array(
             [[1, 0, translation[0]], [0, 1, translation[1]], [0, 0, 1]],
         )
         inverse_translation = np.linalg.inv(forward_translation)
-        transform = inverse_translation @ transform @ forward_translation
-        return cv2.warpAffine(patch, transform[0:-1][:], patch.shape[:2][::-1])
+        return inverse_translation @ transform @ forward_translation
+
+    def _permute_patch(self: AffineWSITransformer, patch: np.ndarray) -> np.ndarray:
+        """Apply the signed permutation transformation to a square patch.
+
+        Args:
+            patch (:class:`numpy.ndarray`):
+                A square region of whole slide image.
+
+        Returns:
+            :class:`numpy.ndarray`:
+                The transformed patch.
+
+        """
+        # Output pixel (x, y) samples the input at inv(R) @ ((x, y) - c) + c,
+        # where inv(R) = R.T for a signed permutation R.
+        inv_rotation = self._permutation.T
+        if inv_rotation[0, 0] != 0:
+            permuted = patch[:: inv_rotation[1, 1], :: inv_rotation[0, 0]]
+        else:
+            permuted = patch.swapaxes(0, 1)[
+                :: inv_rotation[0, 1],
+                :: inv_rotation[1, 0],
+            ]
+        return np.ascontiguousarray(permuted)
 
     def read_rect(
         self: AffineWSITransformer,
@@ -1640,6 +1847,19 @@ class AffineWSITransformer:
                 A transformed region/patch.
 
         """
+        if self._translation is not None:
+            # Whole-pixel shifts (including identity) need no resampling
+            location = (
+                location[0] - self._translation[0],
+                location[1] - self._translation[1],
+            )
+            return self.wsi_reader.read_rect(
+                location,
+                size,
+                resolution=resolution,
+                units=units,
+            )
+
         (
             read_level,
             _level_location,
@@ -1667,9 +1887,9 @@ class AffineWSITransformer:
 
         # Crop to get rid of black borders due to rotation
         start_row = int(max_size[1] / 2) - int(level_size[1] / 2)
-        end_row = int(max_size[1] / 2) + int(level_size[1] / 2)
+        end_row = start_row + level_size[1]
         start_col = int(max_size[0] / 2) - int(level_size[0] / 2)
-        end_col = int(max_size[0] / 2) + int(level_size[0] / 2)
+        end_col = start_col + level_size[0]
         transformed_patch = transformed_patch[start_row:end_row, start_col:end_col, :]
 
         # Resize to desired size
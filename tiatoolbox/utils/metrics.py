@@ -98,9 +98,9 @@ def dice(gt_mask: np.ndarray, pred_mask: np.ndarray) -> float:
         msg = f"{'Shape mismatch between the two masks.'}"
         raise ValueError(msg)
 
-    gt_mask = gt_mask.astype(np.bool_)
-    pred_mask = pred_mask.astype(np.bool_)
-    sum_masks = gt_mask.sum() + pred_mask.sum()
+    gt_mask = np.asarray(gt_mask, dtype=np.bool_)
+    pred_mask = np.asarray(pred_mask, dtype=np.bool_)
+    sum_masks = np.count_nonzero(gt_mask) + np.count_nonzero(pred_mask)
     if sum_masks == 0:
         return np.NAN
-    return 2 * np.logical_and(gt_mask, pred_mask).sum() / sum_masks
+    return 2 * np.count_nonzero(np.logical_and(gt_mask, pred_mask)) / sum_masks